@@ -1,10 +1,27 @@
 """
 Audio Recorder - Captures microphone input using sounddevice
+
+When rtmixer is installed, capture runs in rtmixer's C callback and lands in
+a PortAudio ring buffer, so no Python code runs on the audio thread.
+Otherwise a regular sounddevice callback is used.
 """
 
+import sys
+import ctypes
+import threading
 import numpy as np
 import sounddevice as sd
-from config import SAMPLE_RATE, CHANNELS
+from config import SAMPLE_RATE, CHANNELS, RECORD_SEGMENT_SECONDS
+
+try:
+    import rtmixer
+except ImportError:
+    rtmixer = None
+
+
+def _next_pow2(n):
+    """Smallest power of two >= n (PortAudio ring buffers require it)."""
+    return 1 << (n - 1).bit_length()
 
 
 class AudioRecorder:
@@ -12,39 +29,212 @@ class AudioRecorder:
         self.sample_rate = SAMPLE_RATE
         self.channels = CHANNELS
         self.recording = False
-        self.audio_buffer = []
         self.stream = None
 
-    def _audio_callback(self, indata, frames, time, status):
+        # int16 samples are captured into fixed-size preallocated segments
+        # and converted to float32 into _out off the audio thread. When the
+        # callback reaches the last segment it raises _grow and the consumer
+        # side appends another one, so recordings have no length limit and
+        # the audio thread never allocates.
+        self._segment_len = SAMPLE_RATE * RECORD_SEGMENT_SECONDS
+        self._segments = [np.empty(self._segment_len, dtype=np.int16) for _ in range(2)]
+        self._grow = False
+        self._out = np.empty(self._segment_len * len(self._segments), dtype=np.float32)
+        self._mix = np.empty(self._segment_len, dtype=np.float32)  # Downmix scratch
+        self._write = 0
+        self._converted = 0  # Samples already converted into _out
+        self._read_lock = threading.Lock()  # Serializes the consumer side
+        self._consumer = None
+        self._stop_consumer = threading.Event()  # Wakes the consumer early on stop()
+        self._overflow = False
+        self._xrun_count = 0  # Callback status flags, reported from stop()
+        self._mmcss_registered = False
+
+        # rtmixer writes mono int16 frames straight into this ring buffer
+        self._use_rtmixer = rtmixer is not None and self.channels == 1
+        self._ringbuffer = None
+        if self._use_rtmixer:
+            self._ringbuffer = rtmixer.RingBuffer(
+                elementsize=np.dtype(np.int16).itemsize,
+                size=_next_pow2(self._segment_len)
+            )
+
+    def _register_audio_thread(self):
+        """Move the current (callback) thread into the MMCSS "Pro Audio" class."""
+        self._mmcss_registered = True
+        if sys.platform != "win32":
+            return
+        try:
+            task_index = ctypes.c_ulong(0)
+            ctypes.windll.avrt.AvSetMmThreadCharacteristicsW(
+                "Pro Audio", ctypes.byref(task_index)
+            )
+        except (OSError, AttributeError):
+            pass  # MMCSS unavailable - keep normal priority
+
+    def _audio_callback(self, indata, frames, time_info, status):
         """Callback function called by sounddevice for each audio block."""
+        if not self._mmcss_registered:
+            # PortAudio starts a new callback thread for every stream
+            self._register_audio_thread()
         if status:
-            print(f"Audio status: {status}")
-        if self.recording:
-            self.audio_buffer.append(indata.copy())
+            # No I/O on the audio thread - stop() reports the count
+            self._xrun_count += 1
+        if not self.recording:
+            return
+
+        start = self._write
+        end = self._store(start, indata, frames)
+        # Single producer: publish the cursor only after the samples are in place
+        self._write = end
+
+    def _store(self, start, indata, frames):
+        """
+        Copy a captured block into the segments starting at sample start.
+
+        Returns the new write cursor. Runs on the audio thread: it never
+        allocates, and only flags the consumer when space is running out.
+        """
+        segments = self._segments
+        seg_len = self._segment_len
+        done = 0
+        while done < frames:
+            index, offset = divmod(start + done, seg_len)
+            if index >= len(segments):
+                # Consumer fell behind - drop the rest rather than allocate here
+                self._overflow = True
+                break
+            if index == len(segments) - 1:
+                self._grow = True  # Last segment in use - ask for another
+            n = min(frames - done, seg_len - offset)
+            dest = segments[index][offset:offset + n]
+            if self.channels == 1:
+                # Channel 0 of a (frames, 1) block is a strided view - no copy
+                np.copyto(dest, indata[done:done + n, 0])
+            else:
+                # Downmix through a preallocated scratch to avoid a temporary
+                mix = self._mix[:n]
+                np.mean(indata[done:done + n], axis=1, dtype=np.float32, out=mix)
+                np.copyto(dest, mix, casting="unsafe")
+            done += n
+        return start + done
+
+    def _grow_buffers(self):
+        """Append a capture segment and widen _out. Consumer side only."""
+        self._grow = False
+        self._segments.append(np.empty(self._segment_len, dtype=np.int16))
+        # Earlier peek() views keep the old _out alive, so replace, don't resize
+        out = np.empty(self._segment_len * len(self._segments), dtype=np.float32)
+        out[:self._converted] = self._out[:self._converted]
+        self._out = out
+
+    def _open_stream(self):
+        """Open and start the input stream."""
+        if self._use_rtmixer:
+            self._ringbuffer.flush()
+            self.stream = rtmixer.Recorder(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype="int16",
+                latency="low"
+            )
+            self.stream.start()
+            self.stream.record_ringbuffer(self._ringbuffer)
+        else:
+            self.stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=self.channels,
+                dtype=np.int16,
+                latency="low",
+                callback=self._audio_callback
+            )
+            self.stream.start()
+
+    def _drain_ringbuffer(self):
+        """Move what rtmixer has recorded so far into the capture segments."""
+        while self._ringbuffer.read_available:
+            index, offset = divmod(self._write, self._segment_len)
+            if index >= len(self._segments) - 1:
+                self._grow_buffers()
+            self._write += self._ringbuffer.readinto(self._segments[index][offset:])
+
+    def _collect(self):
+        """
+        Bring _out up to date with everything captured so far.
+
+        Only samples not converted by an earlier call are touched, so
+        repeated calls during a recording stay cheap. Caller holds _read_lock.
+        """
+        if self._use_rtmixer:
+            self._drain_ringbuffer()
+        elif self._grow:
+            self._grow_buffers()
+
+        end = self._write
+        seg_len = self._segment_len
+        while self._converted < end:
+            # Vectorized int16 -> float32 conversion, off the audio thread
+            start = self._converted
+            index, offset = divmod(start, seg_len)
+            n = min(end - start, seg_len - offset)
+            np.multiply(
+                self._segments[index][offset:offset + n], np.float32(1.0 / 32768.0),
+                out=self._out[start:start + n]
+            )
+            self._converted = start + n
+        return end
+
+    def _consume(self):
+        """
+        Drain, grow and convert a few times a second while recording.
+
+        Keeps the callback supplied with free segments (and the rtmixer ring
+        buffer empty) even when nothing calls peek().
+        """
+        while not self._stop_consumer.wait(0.25):
+            with self._read_lock:
+                self._collect()
+
+    def peek(self):
+        """
+        Return the audio captured so far without stopping the recording.
+
+        Safe to call from another thread while recording. The returned
+        float32 array is a view that stays valid until the next start().
+        """
+        with self._read_lock:
+            end = self._collect()
+        return self._out[:end]
 
     def start(self):
         """Start recording audio from the microphone."""
-        self.audio_buffer = []
+        self._write = 0
+        self._converted = 0
+        self._overflow = False
+        self._xrun_count = 0
+        self._mmcss_registered = False
         self.recording = True
         
         try:
             # List available devices for debugging
             print(f"Default input device: {sd.default.device[0]}")
             
-            self.stream = sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=self.channels,
-                dtype=np.float32,
-                callback=self._audio_callback
-            )
-            self.stream.start()
+            self._open_stream()
+            self._stop_consumer.clear()
+            self._consumer = threading.Thread(target=self._consume, daemon=True)
+            self._consumer.start()
             print("Audio stream started successfully")
         except Exception as e:
             print(f"Error starting audio stream: {e}")
             self.recording = False
 
     def stop(self):
-        """Stop recording and return the audio data as a numpy array."""
+        """
+        Stop recording and return the audio data as a numpy array.
+
+        The returned array is a view into the recorder's buffer and stays
+        valid until the next call to start().
+        """
         self.recording = False
         
         if self.stream:
@@ -55,15 +245,27 @@ class AudioRecorder:
                 print(f"Error stopping stream: {e}")
             self.stream = None
 
-        if not self.audio_buffer:
+        if self._consumer:
+            # Wake the consumer instead of waiting out its poll interval;
+            # the final _collect() below picks up whatever it left
+            self._stop_consumer.set()
+            self._consumer.join()
+            self._consumer = None
+
+        with self._read_lock:
+            end = self._collect()
+
+        if self._xrun_count:
+            print(f"Audio status: {self._xrun_count} overflow/underflow blocks")
+
+        if end == 0:
             print("Warning: No audio data captured!")
             return None
 
-        # Concatenate all audio chunks into a single array
-        audio_data = np.concatenate(self.audio_buffer, axis=0)
-        
-        # Flatten to 1D array (mono)
-        audio_data = audio_data.flatten()
+        if self._overflow:
+            print("Warning: Capture buffer could not grow in time; some audio was dropped")
+
+        audio_data = self._out[:end]
         
         print(f"Captured {len(audio_data)} audio samples")
         
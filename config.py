@@ -2,6 +2,8 @@
 Whisper Clone - Configuration
 """
 
+import os
+
 # Hotkey for push-to-talk (G6 key)
 # Note: G6 is typically a macro key that may send a specific keycode
 # We'll detect it via the keyboard listener
@@ -13,9 +15,27 @@ MODEL_PATH = r"C:\Users\David\desktop\whisper.cpp\models\ggml-medium.bin"
 # Audio settings (required by whisper)
 SAMPLE_RATE = 16000  # 16kHz
 CHANNELS = 1         # Mono
+RECORD_SEGMENT_SECONDS = 30  # Capture buffer grows in steps of this length
 
 # Performance settings
-WHISPER_THREADS = 8  # Adjust based on your CPU cores
+def _physical_cores():
+    """Physical core count via psutil, else half the logical count (assumes SMT)."""
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    return cores or max(1, (os.cpu_count() or 2) // 2)
+
+# One inference thread per physical core; SMT siblings only add contention
+# in the int8 GEMM kernels. Set a number here to override.
+WHISPER_THREADS = _physical_cores()
+WHISPER_DEVICE = "cpu"  # "cuda" to run on an NVIDIA GPU
+WHISPER_BEAM_SIZE = 1  # 1 = greedy decoding; 5 trades speed for slightly better accuracy
+
+# Streaming transcription: transcribe finished sentences while still recording
+STREAMING_TRANSCRIPTION = True
+STREAM_CHUNK_SECONDS = 5  # Minimum audio per background chunk
 
 # Typing settings
 USE_CLIPBOARD = True  # True = instant paste, False = character-by-character
@@ -6,9 +6,11 @@ Appears at the top of the screen when recording.
 """
 
 from __future__ import annotations
+import functools
 import tkinter as tk
 import threading
 import time
+from state_bus import State
 
 
 class FlowBar:
@@ -69,6 +71,10 @@ class FlowBar:
         )
         self.dot_canvas.pack(side=tk.LEFT, padx=(12, 6), pady=10)
         self.dot = self.dot_canvas.create_oval(2, 2, 10, 10, fill="#ff4757", outline="")
+        # Darker dot drawn over the main one; the pulse just toggles its visibility
+        self.dot_dim = self.dot_canvas.create_oval(
+            2, 2, 10, 10, fill="#c0392b", outline="", state=tk.HIDDEN
+        )
         
         # Label
         self.label = tk.Label(
@@ -97,113 +103,121 @@ class FlowBar:
     
     def _pulse_animation(self):
         """Animate the recording dot."""
-        if not self.is_recording or not self.root:
+        if not self.is_recording or not self.is_visible or not self.root:
             self.animation_running = False
             return
         
         self.animation_running = True
         self.pulse_count += 1
         
-        # Pulse between bright red and darker red
-        if self.pulse_count % 2 == 0:
-            color = "#ff4757"  # Bright red
-        else:
-            color = "#c0392b"  # Darker red
+        # Pulse between bright red and darker red by showing/hiding the dim dot
+        state = tk.NORMAL if self.pulse_count % 2 else tk.HIDDEN
         
         try:
-            self.dot_canvas.itemconfig(self.dot, fill=color)
+            self.dot_canvas.itemconfigure(self.dot_dim, state=state)
         except:
             pass
         
         # Continue animation
-        if self.is_recording and self.root:
-            self.root.after(500, self._pulse_animation)
-        else:
-            self.animation_running = False
+        self.root.after(500, self._pulse_animation)
+    
+    def _apply_show(self, text):
+        """Show the bar in the recording state (runs on the UI thread)."""
+        try:
+            self.label.config(text=text)
+            self.dot_canvas.itemconfigure(self.dot_dim, state=tk.HIDDEN)
+            self.dot_canvas.itemconfig(self.dot, fill="#ff4757")
+            self.root.deiconify()
+            self.is_visible = True
+            self.is_recording = True
+            
+            # Start pulse animation
+            if not self.animation_running:
+                self._pulse_animation()
+        except:
+            pass
+    
+    def _apply_text(self, text):
+        """Update the label text (runs on the UI thread)."""
+        try:
+            self.label.config(text=text)
+        except:
+            pass
+    
+    def _apply_hide(self):
+        """Hide the bar (runs on the UI thread)."""
+        try:
+            self.is_recording = False
+            self.root.withdraw()
+            self.is_visible = False
+        except:
+            pass
+    
+    def _apply_processing(self):
+        """Switch to the processing state (runs on the UI thread)."""
+        try:
+            self.is_recording = False
+            self.label.config(text="Processing...")
+            self.dot_canvas.itemconfigure(self.dot_dim, state=tk.HIDDEN)
+            self.dot_canvas.itemconfig(self.dot, fill="#ffa502")  # Orange
+        except:
+            pass
+    
+    def _apply_success(self, word_count):
+        """Switch to the success state and schedule hiding (runs on the UI thread)."""
+        try:
+            self.is_recording = False
+            if word_count > 0:
+                self.label.config(text=f"Done! ({word_count} words)")
+            else:
+                self.label.config(text="Done!")
+            self.dot_canvas.itemconfigure(self.dot_dim, state=tk.HIDDEN)
+            self.dot_canvas.itemconfig(self.dot, fill="#2ed573")  # Green
+            # Hide after 1 second
+            self.root.after(1000, self._apply_hide)
+        except:
+            pass
     
     def show(self, text="Recording..."):
         """Show the flow bar."""
         if not self.root:
             return
-            
-        def _show():
-            try:
-                self.label.config(text=text)
-                self.dot_canvas.itemconfig(self.dot, fill="#ff4757")
-                self.root.deiconify()
-                self.is_visible = True
-                self.is_recording = True
-                
-                # Start pulse animation
-                if not self.animation_running:
-                    self._pulse_animation()
-            except:
-                pass
-        
-        self.root.after(0, _show)
+        self.root.after(0, self._apply_show, text)
     
     def update_text(self, text):
         """Update the flow bar text."""
         if not self.root or not self.label:
             return
-            
-        def _update():
-            try:
-                self.label.config(text=text)
-            except:
-                pass
-        
-        self.root.after(0, _update)
+        self.root.after(0, self._apply_text, text)
     
     def hide(self):
         """Hide the flow bar."""
         if not self.root:
             return
-            
-        def _hide():
-            try:
-                self.is_recording = False
-                self.root.withdraw()
-                self.is_visible = False
-            except:
-                pass
-        
-        self.root.after(0, _hide)
+        self.root.after(0, self._apply_hide)
     
     def show_processing(self):
         """Show processing state."""
         if not self.root:
             return
-            
-        def _processing():
-            try:
-                self.is_recording = False
-                self.label.config(text="Processing...")
-                self.dot_canvas.itemconfig(self.dot, fill="#ffa502")  # Orange
-            except:
-                pass
-        
-        self.root.after(0, _processing)
+        self.root.after(0, self._apply_processing)
     
     def show_success(self, word_count=0):
         """Show success state briefly."""
         if not self.root:
             return
-            
-        def _success():
-            try:
-                self.is_recording = False
-                if word_count > 0:
-                    self.label.config(text=f"Done! ({word_count} words)")
-                else:
-                    self.label.config(text="Done!")
-                self.dot_canvas.itemconfig(self.dot, fill="#2ed573")  # Green
-                # Hide after 1 second
-                self.root.after(1000, self.hide)
-            except:
-                pass
-        
-        self.root.after(0, _success)
+        self.root.after(0, self._apply_success, word_count)
+    
+    def on_state(self, state, word_count=0):
+        """State bus subscriber: reflect the app state on the bar."""
+        if state == State.RECORDING:
+            self.show("Recording...")
+        elif state == State.PROCESSING:
+            self.show_processing()
+        elif state == State.SUCCESS:
+            self.show_success(word_count)
+        else:
+            self.hide()
     
     def stop(self):
         """Stop and destroy the flow bar."""
@@ -217,12 +231,7 @@ class FlowBar:
 
 
 # Global instance
-_flow_bar = None
-
-
+@functools.cache
 def get_flow_bar() -> FlowBar:
     """Get the global flow bar instance."""
-    global _flow_bar
-    if _flow_bar is None:
-        _flow_bar = FlowBar()
-    return _flow_bar
+    return FlowBar()
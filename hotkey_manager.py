@@ -6,8 +6,6 @@ Supports configurable hotkeys.
 """
 
 import keyboard
-import threading
-import time
 
 
 # Map of key names to scan codes or keyboard library names
@@ -61,11 +59,14 @@ class HotkeyManager:
         self.hotkey = hotkey
         self.keys = self._parse_hotkey(hotkey)
         self.is_key_pressed = False
-        self.running = False
-        self.monitor_thread = None
+
+        # One bit per key in the combination, set while that key is held
+        self._down_mask = 0
+        self._all_mask = (1 << len(self.keys)) - 1
+        self._hooks = []
 
     def _parse_hotkey(self, hotkey_str):
-        """Parse hotkey string into list of keys."""
+        """Parse hotkey string into a tuple of keys (fixed for the manager's lifetime)."""
         parts = hotkey_str.lower().split("+")
         keys = []
         for part in parts:
@@ -74,50 +75,47 @@ class HotkeyManager:
                 keys.append(KEY_MAP[part])
             else:
                 keys.append(part)
-        return keys
+        return tuple(keys)
 
-    def _check_keys(self):
-        """Monitor thread that checks if hotkey is pressed."""
-        while self.running:
-            # Check if all keys in the hotkey are pressed
-            all_pressed = True
-            for key in self.keys:
-                if isinstance(key, int):
-                    # Scan code
-                    if not keyboard.is_pressed(key):
-                        all_pressed = False
-                        break
-                else:
-                    # Key name
-                    if not keyboard.is_pressed(key):
-                        all_pressed = False
-                        break
+    def _on_key_down(self, bit):
+        """Mark a key as held and fire the press callback once all are down."""
+        self._down_mask |= bit
+        if self._down_mask == self._all_mask and not self.is_key_pressed:
+            # Keys just pressed
+            self.is_key_pressed = True
+            if self.on_press_callback:
+                self.on_press_callback()
 
-            if all_pressed and not self.is_key_pressed:
-                # Keys just pressed
-                self.is_key_pressed = True
-                if self.on_press_callback:
-                    self.on_press_callback()
-            elif not all_pressed and self.is_key_pressed:
-                # Keys just released
-                self.is_key_pressed = False
-                if self.on_release_callback:
-                    self.on_release_callback()
+    def _on_key_up(self, bit):
+        """Mark a key as released and fire the release callback on the first key up."""
+        self._down_mask &= ~bit
+        if self.is_key_pressed and self._down_mask != self._all_mask:
+            # Keys just released
+            self.is_key_pressed = False
+            if self.on_release_callback:
+                self.on_release_callback()
 
-            # Small sleep to prevent high CPU usage
-            time.sleep(0.05)
+    def _on_key_event(self, e, bit):
+        """Route a hooked key's down/up event to the matching handler."""
+        if e.event_type == keyboard.KEY_DOWN:
+            self._on_key_down(bit)
+        elif e.event_type == keyboard.KEY_UP:
+            self._on_key_up(bit)
 
     def start(self):
         """Start listening for hotkey events."""
-        self.running = True
-        self.monitor_thread = threading.Thread(target=self._check_keys, daemon=True)
-        self.monitor_thread.start()
+        for index, key in enumerate(self.keys):
+            # One hook per key: keyboard keeps a single hook per key, so
+            # separate press and release hooks would overwrite each other
+            self._hooks.append(keyboard.hook_key(
+                key, lambda e, bit=1 << index: self._on_key_event(e, bit), suppress=False
+            ))
         display_name = HOTKEY_OPTIONS.get(self.hotkey, self.hotkey.upper())
         print(f"Hotkey listener started. Hold '{display_name}' to record...")
 
     def stop(self):
         """Stop listening for hotkey events."""
-        self.running = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=1)
-        keyboard.unhook_all()
+        for hook in self._hooks:
+            keyboard.unhook(hook)
+        self._hooks = []
+        self._down_mask = 0
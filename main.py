@@ -14,59 +14,69 @@ Controls:
 """
 
 import sys
-import os
 import time
+import argparse
+import ctypes
 import threading
 import subprocess
-import tempfile
-import atexit
-from audio_recorder import AudioRecorder
-from transcriber import Transcriber, AVAILABLE_MODELS
-from text_injector import TextInjector
-from hotkey_manager import HotkeyManager
-from tray_icon import TrayIcon
-from stats_manager import get_stats_manager
+from pathlib import Path
+from models import AVAILABLE_MODELS
 from settings_manager import get_settings
-from flow_bar import get_flow_bar
-from sound_effects import get_sound_effects
+from state_bus import State, StateBus
+from config import SAMPLE_RATE, STREAMING_TRANSCRIPTION
 
 
-# Single instance lock file
-LOCK_FILE = os.path.join(tempfile.gettempdir(), "wisprflow.lock")
+# Single instance mutex (released by Windows when the process exits)
+INSTANCE_MUTEX_NAME = "Global\\WisprFlowSingleton"
+ERROR_ALREADY_EXISTS = 183
+
+# Kept for the lifetime of the process so the mutex stays owned
+_instance_mutex = None
 
 
 def is_already_running():
-    """Check if another instance is already running."""
-    if os.path.exists(LOCK_FILE):
-        # Check if the process is still alive
-        try:
-            with open(LOCK_FILE, "r") as f:
-                pid = int(f.read().strip())
-            # Check if process exists (Windows)
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
-            handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
-            if handle:
-                kernel32.CloseHandle(handle)
-                return True  # Process is still running
-        except (ValueError, OSError, FileNotFoundError):
-            pass  # Lock file is stale or invalid
-    return False
-
-
-def create_lock():
-    """Create lock file with current PID."""
-    with open(LOCK_FILE, "w") as f:
-        f.write(str(os.getpid()))
-
-
-def remove_lock():
-    """Remove lock file on exit."""
-    try:
-        if os.path.exists(LOCK_FILE):
-            os.remove(LOCK_FILE)
-    except:
-        pass
+    """Claim the single-instance mutex; return True if another instance holds it."""
+    global _instance_mutex
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _instance_mutex = kernel32.CreateMutexW(None, True, INSTANCE_MUTEX_NAME)
+    return ctypes.get_last_error() == ERROR_ALREADY_EXISTS
+
+
+# Console control events that end the process without running Python cleanup
+CTRL_CLOSE_EVENT = 2
+CTRL_LOGOFF_EVENT = 5
+CTRL_SHUTDOWN_EVENT = 6
+
+# Kept alive for the process lifetime; Windows calls it from its own thread
+_console_ctrl_handler = None
+
+
+def install_console_handler(app):
+    """Shut the app down cleanly when its console window is closed."""
+    global _console_ctrl_handler
+    handler_routine = ctypes.WINFUNCTYPE(ctypes.c_int, ctypes.c_uint)
+
+    def _on_ctrl(event):
+        if event not in (CTRL_CLOSE_EVENT, CTRL_LOGOFF_EVENT, CTRL_SHUTDOWN_EVENT):
+            return False  # Let Python turn Ctrl+C into KeyboardInterrupt
+        app.tray_icon.stop()
+        app.shutdown()
+        return True
+
+    _console_ctrl_handler = handler_routine(_on_ctrl)
+    ctypes.windll.kernel32.SetConsoleCtrlHandler(_console_ctrl_handler, True)
+
+
+def parse_args():
+    """Parse command line flags. Unknown arguments are ignored."""
+    parser = argparse.ArgumentParser(description="Push-to-talk voice dictation")
+    parser.add_argument(
+        "--auto",
+        action="store_true",
+        help="start with the saved model instead of showing the model menu"
+    )
+    args, _ = parser.parse_known_args()
+    return args
 
 
 def select_model():
@@ -96,8 +106,23 @@ def select_model():
             print("Invalid choice. Please enter 1, 2, 3, or 4.")
 
 
+def preload_in_background(model_name):
+    """Import faster-whisper and warm the model files off the main thread."""
+    from transcriber import preload_model_files
+    preload_model_files(model_name)
+
+
 class WhisperClone:
     def __init__(self, model_name="base"):
+        # Heavy modules (numpy, faster-whisper, pystray, tkinter) are imported
+        # here rather than at the top so the model menu comes up right away
+        from audio_recorder import AudioRecorder
+        from transcriber import Transcriber
+        from text_injector import TextInjector
+        from hotkey_manager import HotkeyManager
+        from tray_icon import TrayIcon
+        from stats_manager import get_stats_manager
+        
         self.audio_recorder = AudioRecorder()
         self.transcriber = Transcriber(model_name=model_name)
         self.text_injector = TextInjector()
@@ -108,53 +133,86 @@ class WhisperClone:
         # Initialize flow bar and sound effects based on settings
         self.flow_bar = None
         self.sound_effects = None
+        self.state_bus = StateBus()
+        
+        self.tray_icon = TrayIcon(
+            on_quit_callback=self.shutdown,
+            on_open_stats_callback=self.open_stats_gui
+        )
+        self.state_bus.subscribe(self.tray_icon.on_state)
         
         if self.settings.flow_bar_enabled:
+            from flow_bar import get_flow_bar
             self.flow_bar = get_flow_bar()
             self.flow_bar.start()
+            self.state_bus.subscribe(self.flow_bar.on_state)
         
         if self.settings.sound_effects_enabled:
+            from sound_effects import get_sound_effects
             self.sound_effects = get_sound_effects()
+            self.state_bus.subscribe(self.sound_effects.on_state)
         
-        self.tray_icon = TrayIcon(
-            on_quit_callback=self.shutdown,
-            on_open_stats_callback=self.open_stats_gui
-        )
         self.hotkey_manager = HotkeyManager(
             on_press_callback=self.on_record_start,
             on_release_callback=self.on_record_stop,
             hotkey=self.settings.hotkey
         )
         self.running = True
-        self.processing = False
+        # Set from key release until the transcription is done
+        self._busy = threading.Event()
+        self._stream = None  # StreamingSession of the current recording
         self.gui_process = None
+        
+        # Stats GUI launch command, resolved once from this file's location
+        app_dir = Path(__file__).resolve().parent
+        self._stats_gui_cmd = [sys.executable, str(app_dir / "stats_gui.py")]
+        self._stats_gui_cwd = str(app_dir)
+        
+        # Load and warm up the model while the tray and hotkeys come up
+        self._model_ready = threading.Event()
+        threading.Thread(target=self._warm_model, daemon=True).start()
+
+    def _warm_model(self):
+        """Load the whisper model and run a warm-up inference (background thread)."""
+        try:
+            self.transcriber.load_model()
+            self.transcriber.warm_up()
+        except Exception as e:
+            print(f"Error loading model: {e}")
+        finally:
+            self._model_ready.set()
 
     def open_stats_gui(self):
         """Open the stats GUI in a separate process."""
+        if self.gui_process and self.gui_process.poll() is None:
+            return  # Already open
+        
         try:
             # Launch stats GUI as separate process
             self.gui_process = subprocess.Popen(
-                [sys.executable, "stats_gui.py"],
-                cwd=sys.path[0] or "."
+                self._stats_gui_cmd,
+                cwd=self._stats_gui_cwd
             )
         except Exception as e:
             print(f"Error opening stats GUI: {e}")
 
     def on_record_start(self):
         """Called when push-to-talk key is pressed."""
-        if self.processing:
+        if self._busy.is_set():
             return  # Don't start new recording while processing
             
         print("Recording started...")
-        self.tray_icon.set_recording(True)
-        
-        # Show flow bar and play sound
-        if self.flow_bar:
-            self.flow_bar.show("Recording...")
-        if self.sound_effects:
-            self.sound_effects.play_start()
-        
+        self.state_bus.publish(State.RECORDING)
+        self.text_injector.remember_target()
         self.audio_recorder.start()
+        
+        # Start transcribing in the background once the model is available
+        self._stream = None
+        if (STREAMING_TRANSCRIPTION and self._model_ready.is_set()
+                and self.audio_recorder.is_recording()):
+            from transcriber import StreamingSession
+            self._stream = StreamingSession(self.transcriber, self.audio_recorder.peek)
+            self._stream.start()
 
     def on_record_stop(self):
         """Called when push-to-talk key is released."""
@@ -162,13 +220,8 @@ class WhisperClone:
             return
             
         print("Recording stopped. Processing...")
-        self.processing = True
-        
-        # Play stop sound and update flow bar
-        if self.sound_effects:
-            self.sound_effects.play_stop()
-        if self.flow_bar:
-            self.flow_bar.show_processing()
+        self._busy.set()
+        self.state_bus.publish(State.PROCESSING)
         
         # Stop recording and get audio data
         audio_data = self.audio_recorder.stop()
@@ -177,62 +230,65 @@ class WhisperClone:
             # Transcribe in a separate thread to keep UI responsive
             threading.Thread(
                 target=self._process_audio,
-                args=(audio_data,),
+                args=(audio_data, self._stream),
                 daemon=True
             ).start()
         else:
             print("No audio recorded.")
-            self.tray_icon.set_recording(False)
-            if self.flow_bar:
-                self.flow_bar.hide()
-            self.processing = False
+            if self._stream:
+                self._stream.cancel()
+            self.state_bus.publish(State.IDLE)
+            self._busy.clear()
 
-    def _process_audio(self, audio_data):
-        """Process audio data: transcribe and inject text."""
+    def _process_audio(self, audio_data, stream=None):
+        """
+        Process audio data: transcribe and inject text.
+        
+        Args:
+            audio_data: The complete recording
+            stream: StreamingSession that already transcribed part of it, if any
+        """
         try:
             # Calculate audio duration for info
-            duration = len(audio_data) / 16000  # 16kHz sample rate
+            duration = len(audio_data) / SAMPLE_RATE
             print(f"Audio duration: {duration:.1f} seconds")
             
+            # First press may arrive while the model is still loading
+            if not self._model_ready.is_set():
+                print("Waiting for model to finish loading...")
+                self._model_ready.wait()
+            
             # Transcribe
             print("Transcribing...")
             start_time = time.time()
-            text = self.transcriber.transcribe(audio_data)
+            if stream:
+                text = stream.finish(audio_data)
+            else:
+                text = self.transcriber.transcribe(audio_data)
             elapsed = time.time() - start_time
             print(f"Transcription took {elapsed:.1f} seconds")
             
             if text:
                 print(f"Transcribed: {text}")
                 
-                # Record stats
-                word_count = len(text.split())
-                self.stats.add_transcription(text, duration, self.model_name)
+                # Record stats (also gives us the word count for the flow bar)
+                word_count = self.stats.add_transcription(text, duration, self.model_name)
                 
                 # Show success on flow bar
-                if self.flow_bar:
-                    self.flow_bar.show_success(word_count)
-                if self.sound_effects:
-                    self.sound_effects.play_success()
+                self.state_bus.publish(State.SUCCESS, word_count=word_count)
                 
-                # Small delay to ensure the target window has focus
-                time.sleep(0.1)
-                # Inject the text
+                # Inject the text (into the window focused when recording started)
                 self.text_injector.inject(text)
                 print("Text injected!")
             else:
                 print("No speech detected.")
-                if self.flow_bar:
-                    self.flow_bar.hide()
+                self.state_bus.publish(State.IDLE)
                 
         except Exception as e:
             print(f"Error processing audio: {e}")
-            if self.flow_bar:
-                self.flow_bar.hide()
-            if self.sound_effects:
-                self.sound_effects.play_error()
+            self.state_bus.publish(State.ERROR)
         finally:
-            self.tray_icon.set_recording(False)
-            self.processing = False
+            self._busy.clear()
 
     def shutdown(self):
         """Clean shutdown of all components."""
@@ -241,14 +297,17 @@ class WhisperClone:
         self.hotkey_manager.stop()
         if self.flow_bar:
             self.flow_bar.stop()
+        # Write debounced saves now: closing the console or logging off ends
+        # the process as soon as the control handler returns, skipping atexit
+        self.stats.flush()
+        self.settings.flush()
 
     def run(self):
         """Main entry point - starts all components."""
         print()
         
-        # Load the whisper model
+        # The model is loading in the background (see _warm_model)
         print("Initializing...")
-        self.transcriber.load_model()
         print()
         
         # Start hotkey listener
@@ -269,7 +328,7 @@ class WhisperClone:
 
 def main():
     # Check for --auto flag (launched from GUI shortcut)
-    auto_mode = "--auto" in sys.argv
+    auto_mode = parse_args().auto
     
     # Prevent multiple instances
     if is_already_running():
@@ -277,22 +336,26 @@ def main():
         print("Check your system tray for the existing instance.")
         sys.exit(0)
     
-    # Create lock file and register cleanup
-    create_lock()
-    atexit.register(remove_lock)
-    
     if auto_mode:
         # Use saved model from settings
         settings = get_settings()
         model_name = settings.current_model
         print(f"Auto-starting with model: {model_name}")
     else:
+        # Warm the last used model's files while the user picks one
+        threading.Thread(
+            target=preload_in_background,
+            args=(get_settings().current_model,),
+            daemon=True
+        ).start()
+        
         # Show model selection menu
         model_name = select_model()
     
     print()
     
     app = WhisperClone(model_name=model_name)
+    install_console_handler(app)
     try:
         app.run()
     except KeyboardInterrupt:
@@ -301,8 +364,6 @@ def main():
     except Exception as e:
         print(f"Fatal error: {e}")
         sys.exit(1)
-    finally:
-        remove_lock()
 
 
 if __name__ == "__main__":
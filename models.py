@@ -0,0 +1,14 @@
+"""
+Whisper Clone - Model catalogue
+
+Kept free of heavy imports so the model menu and the stats GUI can list
+models without loading faster-whisper.
+"""
+
+# Available models with descriptions
+AVAILABLE_MODELS = {
+    "1": ("tiny", "Tiny (~75MB) - Fastest, lower accuracy"),
+    "2": ("base", "Base (~142MB) - Fast, decent accuracy"),
+    "3": ("small", "Small (~466MB) - Medium speed, good accuracy"),
+    "4": ("medium", "Medium (~1.5GB) - Slower, better accuracy"),
+}
@@ -5,10 +5,17 @@ Manages app settings with JSON persistence.
 """
 
 from __future__ import annotations
+import atexit
+import functools
 import json
 import os
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Timer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
 
 
 # Default settings
@@ -20,6 +27,9 @@ DEFAULT_SETTINGS = {
     "language": "en",      # Transcription language
 }
 
+# Changes are written to disk at most this often (seconds)
+SAVE_DELAY = 0.25
+
 
 class SettingsManager:
     """Manages application settings with persistence."""
@@ -31,41 +41,70 @@ class SettingsManager:
         self.settings_file = self.data_dir / "settings.json"
         self.lock = Lock()
         
-        # Load existing settings or create new
+        # Load existing settings or create new. The dict is never mutated
+        # after publication: writers swap in a new copy, so readers need no lock
         self.settings = self._load_settings()
+        
+        # Pending-write state; bursts of set() calls collapse into one save
+        self._dirty = False
+        self._flush_timer = None
+        atexit.register(self.flush)
     
     def _load_settings(self) -> dict:
         """Load settings from JSON file."""
-        if self.settings_file.exists():
-            try:
-                with open(self.settings_file, "r", encoding="utf-8") as f:
-                    saved = json.load(f)
-                    # Merge with defaults (in case new settings were added)
-                    merged = DEFAULT_SETTINGS.copy()
-                    merged.update(saved)
-                    return merged
-            except (json.JSONDecodeError, IOError):
-                pass
+        try:
+            raw = self.settings_file.read_bytes()
+            saved = orjson.loads(raw) if orjson else json.loads(raw)
+            # Merge with defaults (in case new settings were added)
+            merged = DEFAULT_SETTINGS.copy()
+            merged.update(saved)
+            return merged
+        except (json.JSONDecodeError, IOError):
+            pass  # Missing or unreadable - use defaults
         
         return DEFAULT_SETTINGS.copy()
     
     def _save_settings(self):
-        """Save settings to JSON file."""
+        """Save settings to JSON file (via a temp file, so it is never half-written)."""
+        tmp_file = self.settings_file.with_suffix(".tmp")
+        if orjson:
+            data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.settings, indent=2).encode("utf-8")
         try:
-            with open(self.settings_file, "w", encoding="utf-8") as f:
-                json.dump(self.settings, f, indent=2)
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.settings_file)
         except IOError as e:
             print(f"Error saving settings: {e}")
     
+    def _schedule_save(self):
+        """Mark settings dirty and start the flush timer. Caller holds the lock."""
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = Timer(SAVE_DELAY, self.flush)
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write pending changes to disk now."""
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._save_settings()
+                self._dirty = False
+    
     def get(self, key: str, default=None):
         """Get a setting value."""
         return self.settings.get(key, default)
     
     def set(self, key: str, value):
-        """Set a setting value and save."""
+        """Set a setting value and schedule a save."""
         with self.lock:
-            self.settings[key] = value
-            self._save_settings()
+            updated = dict(self.settings)
+            updated[key] = value
+            self.settings = updated
+            self._schedule_save()
     
     def get_all(self) -> dict:
         """Get all settings."""
@@ -116,16 +155,11 @@ class SettingsManager:
         """Reset all settings to defaults."""
         with self.lock:
             self.settings = DEFAULT_SETTINGS.copy()
-            self._save_settings()
+            self._schedule_save()
 
 
 # Global instance
-_settings_manager = None
-
-
+@functools.cache
 def get_settings() -> SettingsManager:
     """Get the global settings manager instance."""
-    global _settings_manager
-    if _settings_manager is None:
-        _settings_manager = SettingsManager()
-    return _settings_manager
+    return SettingsManager()
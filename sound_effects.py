@@ -6,9 +6,45 @@ Uses winsound for Windows native sound playback (no dependencies).
 """
 
 from __future__ import annotations
-import winsound
+import functools
 import threading
-import os
+import queue
+import io
+import math
+import wave
+from array import array
+from dataclasses import dataclass
+from state_bus import State
+
+
+# Sample rate of the pre-rendered tones
+_TONE_RATE = 22050
+
+
+@dataclass(frozen=True)
+class Tone:
+    """A generated feedback tone."""
+    freq: int      # Hz
+    duration: int  # ms
+
+
+def _synth_wav(frequency: int, duration: int) -> bytes:
+    """Render a sine tone (duration in ms) as an in-memory 16-bit mono WAV file."""
+    n = _TONE_RATE * duration // 1000
+    fade = max(1, min(n // 2, _TONE_RATE // 200))  # 5 ms fade in/out avoids clicks
+    step = 2 * math.pi * frequency / _TONE_RATE
+    samples = array("h", (
+        int(16000 * min(1.0, i / fade, (n - i) / fade) * math.sin(step * i))
+        for i in range(n)
+    ))
+    
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(_TONE_RATE)
+        wav.writeframes(samples.tobytes())
+    return buf.getvalue()
 
 
 class SoundEffects:
@@ -16,48 +52,72 @@ class SoundEffects:
     
     # Sound frequencies and durations for generated tones
     SOUNDS = {
-        "start": {"freq": 800, "duration": 100},      # Higher pitch, short beep
-        "stop": {"freq": 600, "duration": 100},       # Lower pitch, short beep  
-        "success": {"freq": 1000, "duration": 150},   # High pitch for success
-        "error": {"freq": 300, "duration": 200},      # Low pitch for error
+        "start": Tone(freq=800, duration=100),      # Higher pitch, short beep
+        "stop": Tone(freq=600, duration=100),       # Lower pitch, short beep
+        "success": Tone(freq=1000, duration=150),   # High pitch for success
+        "error": Tone(freq=300, duration=200),      # Low pitch for error
     }
     
     def __init__(self, enabled=True):
         self.enabled = enabled
+        
+        # Render every tone once; playback then goes through the normal
+        # wave-out path instead of the legacy Beep tone generator
+        self._wavs = {
+            name: _synth_wav(tone.freq, tone.duration)
+            for name, tone in self.SOUNDS.items()
+        }
+        
+        # One long-lived worker plays queued sounds in order
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
     
-    def _play_tone(self, frequency: int, duration: int):
-        """Play a tone in a separate thread (non-blocking)."""
-        if not self.enabled:
-            return
+    def _run(self):
+        """Worker loop: play sounds as they are queued."""
+        import winsound  # Imported on the worker, off the startup path
         
-        def _play():
+        while True:
+            wav = self._queue.get()
             try:
-                winsound.Beep(frequency, duration)
+                # winsound cannot play from memory asynchronously, so the
+                # worker blocks here instead of the caller
+                winsound.PlaySound(wav, winsound.SND_MEMORY | winsound.SND_NODEFAULT)
             except:
                 pass  # Ignore errors (e.g., no audio device)
-        
-        thread = threading.Thread(target=_play, daemon=True)
-        thread.start()
+    
+    def _play(self, name: str):
+        """Queue a pre-rendered sound for the worker thread (non-blocking)."""
+        if not self.enabled:
+            return
+        self._queue.put_nowait(self._wavs[name])
     
     def play_start(self):
         """Play sound when recording starts."""
-        sound = self.SOUNDS["start"]
-        self._play_tone(sound["freq"], sound["duration"])
+        self._play("start")
     
     def play_stop(self):
         """Play sound when recording stops."""
-        sound = self.SOUNDS["stop"]
-        self._play_tone(sound["freq"], sound["duration"])
+        self._play("stop")
     
     def play_success(self):
         """Play sound on successful transcription."""
-        sound = self.SOUNDS["success"]
-        self._play_tone(sound["freq"], sound["duration"])
+        self._play("success")
     
     def play_error(self):
         """Play sound on error."""
-        sound = self.SOUNDS["error"]
-        self._play_tone(sound["freq"], sound["duration"])
+        self._play("error")
+    
+    def on_state(self, state, **data):
+        """State bus subscriber: play the sound for the new app state."""
+        if state == State.RECORDING:
+            self.play_start()
+        elif state == State.PROCESSING:
+            self.play_stop()
+        elif state == State.SUCCESS:
+            self.play_success()
+        elif state == State.ERROR:
+            self.play_error()
     
     def set_enabled(self, enabled: bool):
         """Enable or disable sound effects."""
@@ -65,12 +125,7 @@ class SoundEffects:
 
 
 # Global instance
-_sound_effects = None
-
-
+@functools.cache
 def get_sound_effects() -> SoundEffects:
     """Get the global sound effects instance."""
-    global _sound_effects
-    if _sound_effects is None:
-        _sound_effects = SoundEffects()
-    return _sound_effects
+    return SoundEffects()
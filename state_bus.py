@@ -0,0 +1,42 @@
+"""
+Whisper - State Bus
+
+Fans out app state changes (recording, processing, done, ...) to the
+feedback components: tray icon, flow bar and sound effects.
+"""
+
+from __future__ import annotations
+
+
+class State:
+    """App states published on the state bus."""
+    IDLE = "idle"
+    RECORDING = "recording"
+    PROCESSING = "processing"
+    SUCCESS = "success"
+    ERROR = "error"
+
+
+class StateBus:
+    """Delivers each published state to every subscriber, in order."""
+    
+    def __init__(self):
+        self._subscribers = []
+    
+    def subscribe(self, callback):
+        """
+        Register a subscriber.
+        
+        Args:
+            callback: Called as callback(state, **data) for every publish.
+                Should return quickly; components hand work to their own thread.
+        """
+        self._subscribers.append(callback)
+    
+    def publish(self, state: str, **data):
+        """Publish a state change to all subscribers."""
+        for callback in self._subscribers:
+            try:
+                callback(state, **data)
+            except Exception as e:
+                print(f"State subscriber error: {e}")
@@ -6,18 +6,141 @@ A minimal, modern Flet-based dashboard for viewing transcription stats and setti
 
 from __future__ import annotations
 import os
+import random
+import functools
 import flet as ft
 import asyncio
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import date, datetime
 from stats_manager import get_stats_manager
 from settings_manager import get_settings
-from transcriber import AVAILABLE_MODELS
+from models import AVAILABLE_MODELS
 from hotkey_manager import HOTKEY_OPTIONS
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 ICON_PATH = os.path.join(SCRIPT_DIR, "assets", "icon.ico")
 
+# Stats file polling: fast right after a change, backing off while idle
+POLL_MIN_SECONDS = 0.5
+POLL_MAX_SECONDS = 10.0
+POLL_BACKOFF = 1.5
+
+# Model lookups, built once
+_MODEL_NAME_TO_KEY = {name: key for key, (name, _) in AVAILABLE_MODELS.items()}
+# (key, label) pairs rather than Option controls: a control can only be
+# mounted in one dropdown, so the Options are made per dropdown
+_MODEL_OPTION_LABELS = tuple(
+    (key, desc) for key, (name, desc) in AVAILABLE_MODELS.items()
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_format_time(seconds: float) -> str:
+    """Format seconds into readable time."""
+    if seconds < 60:
+        return f"{seconds:.1f}s"
+    elif seconds < 3600:
+        mins = int(seconds // 60)
+        secs = int(seconds % 60)
+        return f"{mins}m {secs}s"
+    else:
+        hours = int(seconds // 3600)
+        mins = int((seconds % 3600) // 60)
+        return f"{hours}h {mins}m"
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_format_timestamp(timestamp: float | str, today: int) -> str:
+    """
+    Format a record timestamp to readable format.
+    
+    Records never change, so results are cached; passing today's date
+    ordinal makes "Today"/"Yesterday" entries expire at midnight.
+    
+    Args:
+        timestamp: Epoch seconds, or an ISO string in records written by
+            older versions
+        today: Today's date ordinal
+    """
+    try:
+        if isinstance(timestamp, str):
+            dt = datetime.fromisoformat(timestamp)
+        else:
+            dt = datetime.fromtimestamp(timestamp)
+        days_ago = today - dt.toordinal()
+        
+        if days_ago == 0:
+            return dt.strftime("Today %H:%M")
+        elif days_ago == 1:
+            return dt.strftime("Yesterday %H:%M")
+        else:
+            return dt.strftime("%b %d, %H:%M")
+    except:
+        return str(timestamp)[:16]
+
+
+# Text styles shared across the window
+_caption_text = functools.partial(ft.Text, size=11, color=ft.colors.GREY_500)
+_stat_value_text = functools.partial(ft.Text, size=28, weight=ft.FontWeight.BOLD)
+_title_text = functools.partial(ft.Text, size=14, weight=ft.FontWeight.W_500)
+
+# History row styling, resolved once instead of per row
+_ROW_PADDING = 12
+_ROW_RADIUS = 8
+_ROW_BG = ft.colors.GREY_900
+_ROW_MARGIN = ft.margin.only(bottom=8)
+_ROW_WORDS_COLOR = ft.colors.BLUE_400
+
+
+class HistoryItem(ft.Container):
+    """
+    A history list row.
+    
+    The row's controls are built once; set_record() only changes their
+    values, so a row can be reused for a different record.
+    """
+    
+    def __init__(self):
+        self.record = None  # Record shown by this row
+        self._timestamp_text = _caption_text()
+        self._words_text = ft.Text(size=11, color=_ROW_WORDS_COLOR)
+        self._body_text = ft.Text(
+            size=13,
+            max_lines=2,
+            overflow=ft.TextOverflow.ELLIPSIS,
+        )
+        super().__init__(
+            content=ft.Column(
+                controls=[
+                    ft.Row(
+                        controls=[self._timestamp_text, self._words_text],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                    ),
+                    self._body_text,
+                ],
+                spacing=4,
+            ),
+            padding=_ROW_PADDING,
+            border_radius=_ROW_RADIUS,
+            bgcolor=_ROW_BG,
+            margin=_ROW_MARGIN,
+        )
+    
+    def set_record(self, record: dict, timestamp: str):
+        """
+        Show a history record in this row.
+        
+        Args:
+            record: History record from StatsManager.get_history()
+            timestamp: The record's formatted timestamp
+        """
+        self.record = record
+        self._timestamp_text.value = timestamp
+        self._words_text.value = f"{record['word_count']} words"
+        self._body_text.value = record["text"]
+        self.visible = True
+
 
 class WhisperGUI:
     def __init__(self, on_model_change=None):
@@ -36,148 +159,272 @@ class WhisperGUI:
         self.word_count_text = None
         self.transcription_count_text = None
         self.audio_time_text = None
+        self._stat_cards = None  # Built on first use (see _build_stat_cards)
         self.history_list = None
+        self._rendered_ids = []  # Timestamps of the rows in history_list
         self.model_dropdown = None
         
         # Settings UI references
         self.flow_bar_switch = None
         self.sound_effects_switch = None
         self.hotkey_dropdown = None
+        self._settings_tab = None
+        self._clear_dialog = None
+        
+        # page.update() coalescing (see _batch)
+        self._batch_depth = 0
+        self._pending_updates = []  # Controls to update; None = whole page
+        
+        # Stats change signal, created on Flet's event loop by _redraw_loop
+        self._loop = None
+        self._stats_changed = None
         
-        # For tracking changes
-        self.last_transcription_count = 0
-        self.refresh_running = False
+        # Background tasks and the midnight relabel timer, cancelled when
+        # the window closes
+        self._tasks = []
+        self._relabel_handle = None
+    
+    @contextmanager
+    def _batch(self):
+        """Coalesce the page updates queued inside the block into one."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending_updates:
+                pending, self._pending_updates = self._pending_updates, []
+                self._send_updates(pending)
+    
+    def _queue_update(self, *controls):
+        """
+        Update controls now, or at the end of the enclosing _batch().
+        
+        Args:
+            controls: Controls whose changes to send; none means the whole page
+        """
+        pending = list(controls) or [None]
+        if self._batch_depth:
+            self._pending_updates.extend(pending)
+        else:
+            self._send_updates(pending)
+    
+    def _send_updates(self, pending: list):
+        """Send queued changes: only the listed controls unless the page was queued."""
+        if not self.page:
+            return
+        if None in pending:
+            self.page.update()
+            return
+        # Controls not on the page yet are sent when they are added
+        mounted = [control for control in dict.fromkeys(pending) if control.page]
+        if mounted:
+            self.page.update(*mounted)
     
     def _format_time(self, seconds: float) -> str:
         """Format seconds into readable time."""
-        if seconds < 60:
-            return f"{seconds:.1f}s"
-        elif seconds < 3600:
-            mins = int(seconds // 60)
-            secs = int(seconds % 60)
-            return f"{mins}m {secs}s"
-        else:
-            hours = int(seconds // 3600)
-            mins = int((seconds % 3600) // 60)
-            return f"{hours}h {mins}m"
+        return _cached_format_time(seconds)
     
-    def _format_timestamp(self, iso_timestamp: str) -> str:
-        """Format ISO timestamp to readable format."""
-        try:
-            dt = datetime.fromisoformat(iso_timestamp)
-            now = datetime.now()
-            
-            if dt.date() == now.date():
-                return dt.strftime("Today %H:%M")
-            elif (now.date() - dt.date()).days == 1:
-                return dt.strftime("Yesterday %H:%M")
-            else:
-                return dt.strftime("%b %d, %H:%M")
-        except:
-            return iso_timestamp[:16]
+    def _format_timestamp(self, timestamp: float | str, today: int = None) -> str:
+        """
+        Format a record timestamp to readable format.
+        
+        Args:
+            timestamp: Record timestamp (epoch seconds or legacy ISO string)
+            today: Today's date ordinal; pass it when formatting many records
+        """
+        if today is None:
+            today = date.today().toordinal()
+        return _cached_format_timestamp(timestamp, today)
     
-    def _build_history_item(self, record: dict):
+    def _build_history_item(self, record: dict, today: int = None):
         """Build a history list item."""
-        return ft.Container(
-            content=ft.Column(
-                controls=[
-                    ft.Row(
-                        controls=[
-                            ft.Text(
-                                self._format_timestamp(record["timestamp"]),
-                                size=11,
-                                color=ft.colors.GREY_500,
-                            ),
-                            ft.Text(
-                                f"{record['word_count']} words",
-                                size=11,
-                                color=ft.colors.BLUE_400,
-                            ),
-                        ],
-                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                    ),
-                    ft.Text(
-                        record["text"],
-                        size=13,
-                        max_lines=2,
-                        overflow=ft.TextOverflow.ELLIPSIS,
-                    ),
-                ],
-                spacing=4,
-            ),
-            padding=12,
-            border_radius=8,
-            bgcolor=ft.colors.GREY_900,
-            margin=ft.margin.only(bottom=8),
-        )
+        row = HistoryItem()
+        row.set_record(record, self._format_timestamp(record["timestamp"], today))
+        return row
     
     def _refresh_stats(self):
-        """Refresh all stats displays."""
-        if self.word_count_text:
-            self.word_count_text.value = str(self.stats.get_total_words())
-        if self.transcription_count_text:
-            self.transcription_count_text.value = str(self.stats.get_total_transcriptions())
-        if self.audio_time_text:
-            self.audio_time_text.value = self._format_time(self.stats.get_total_audio_time())
-        if self.page:
-            self.page.update()
+        """Refresh all stats displays, sending only the values that changed."""
+        changed = []
+        for text, value in (
+            (self.word_count_text, str(self.stats.get_total_words())),
+            (self.transcription_count_text, str(self.stats.get_total_transcriptions())),
+            (self.audio_time_text, self._format_time(self.stats.get_total_audio_time())),
+        ):
+            if text and text.value != value:
+                text.value = value
+                changed.append(text)
+        if changed:
+            self._queue_update(*changed)
     
     def _refresh_history(self):
-        """Refresh the history list."""
+        """
+        Refresh the history list.
+        
+        New records are prepended to the existing rows; the list is only
+        rebuilt from scratch when older records changed (e.g. cleared).
+        Rows are recycled: ones that are no longer needed stay at the end
+        of the list, hidden, and are reused before any new row is built.
+        """
         if self.history_list:
-            self.history_list.controls.clear()
             history = self.stats.get_history(limit=50)
+            ids = [record["timestamp"] for record in history]
+            rendered = self._rendered_ids
+            controls = self.history_list.controls
+            today = date.today().toordinal()  # Once per refresh, not per row
+            
+            # Number of new records on top of the rows already shown
+            new_count = ids.index(rendered[0]) if rendered and rendered[0] in ids else -1
             
             if not history:
-                self.history_list.controls.append(
-                    ft.Container(
-                        content=ft.Text(
-                            "No transcriptions yet.\nHold Ctrl+Win to record.",
-                            size=14,
-                            color=ft.colors.GREY_500,
-                            text_align=ft.TextAlign.CENTER,
-                        ),
-                        padding=40,
-                        alignment=ft.alignment.center,
-                    )
-                )
+                spare = [row for row in controls if isinstance(row, HistoryItem)]
+                for row in spare:
+                    row.visible = False
+                controls[:] = [self._history_placeholder()] + spare
+            elif new_count >= 0 and ids[new_count:] == rendered[:len(ids) - new_count]:
+                if new_count == 0 and len(ids) == len(rendered):
+                    return  # Nothing changed
+                # Rows pushed off the end (and hidden ones) become the spares
+                kept = len(ids) - new_count
+                spare = controls[kept:]
+                del controls[kept:]
+                controls[0:0] = [
+                    self._recycle_row(spare, record, today) for record in history[:new_count]
+                ]
+                for row in spare:
+                    row.visible = False
+                controls.extend(spare)
             else:
-                for record in history:
-                    self.history_list.controls.append(
-                        self._build_history_item(record)
-                    )
-            
-            if self.page:
-                self.page.update()
+                spare = [row for row in controls if isinstance(row, HistoryItem)]
+                spare.reverse()  # pop() hands them out in their current order
+                rows = [self._recycle_row(spare, record, today) for record in history]
+                for row in spare:
+                    row.visible = False
+                controls[:] = rows + spare
+            self._rendered_ids = ids
+            self._queue_update(self.history_list)
+    
+    def _recycle_row(self, spare: list, record: dict, today: int):
+        """Show a record in a row taken from spare, or in a new row if none are left."""
+        if not spare:
+            return self._build_history_item(record, today)
+        row = spare.pop()
+        row.set_record(record, self._format_timestamp(record["timestamp"], today))
+        return row
+    
+    def _history_placeholder(self):
+        """Build the empty-history message."""
+        return ft.Container(
+            content=ft.Text(
+                "No transcriptions yet.\nHold Ctrl+Win to record.",
+                size=14,
+                color=ft.colors.GREY_500,
+                text_align=ft.TextAlign.CENTER,
+            ),
+            padding=40,
+            alignment=ft.alignment.center,
+        )
     
     def refresh(self):
         """Refresh all UI elements."""
-        self._refresh_stats()
-        self._refresh_history()
+        with self._batch():
+            self._refresh_stats()
+            self._refresh_history()
+    
+    def _on_stats_changed(self):
+        """Stats listener (any thread): wake the redraw task."""
+        if self._loop is None:
+            self.refresh()  # Redraw task not running yet
+        else:
+            self._loop.call_soon_threadsafe(self._stats_changed.set)
+    
+    def _call_on_loop(self, callback, *args):
+        """Run callback on Flet's event loop, where all redraws happen.
+
+        Flet runs event handlers on worker threads; handing their UI work
+        to the loop keeps refresh() and the update batch single-threaded.
+        """
+        if self._loop is None:
+            callback(*args)  # Redraw task not running yet
+        else:
+            self._loop.call_soon_threadsafe(callback, *args)
+    
+    async def _redraw_loop(self):
+        """Redraw on the event loop whenever a stats change is signalled."""
+        self._stats_changed = asyncio.Event()
+        self._loop = asyncio.get_running_loop()  # Listener may signal from now on
+        self._schedule_midnight_relabel()
+        while True:
+            await self._stats_changed.wait()
+            # Let a burst of changes settle into a single redraw
+            await asyncio.sleep(0.005)
+            self._stats_changed.clear()
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Redraw error: {e}")
+    
+    async def _poll_stats(self) -> bool:
+        """Reload stats from disk. Returns True if they changed."""
+        # File I/O and JSON parsing run on a worker thread so the event
+        # loop keeps handling clicks and scrolling meanwhile
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.stats.reload)
     
     async def _auto_refresh_loop(self):
-        """Background task that refreshes stats every 2 seconds."""
-        self.refresh_running = True
-        while self.refresh_running:
+        """
+        Background task that picks up transcriptions recorded by the app.
+        
+        The app runs in another process, so its writes only reach this
+        StatsManager through reload(), which signals _redraw_loop.
+        Polls every POLL_MIN_SECONDS after a change, backing off to
+        POLL_MAX_SECONDS while nothing is recorded.
+        """
+        loop = asyncio.get_running_loop()
+        interval = POLL_MIN_SECONDS
+        while True:
+            started = loop.time()
             try:
-                # Reload stats from disk to get latest data
-                self.stats.stats = self.stats._load_stats()
-                
-                # Check if there are new transcriptions
-                current_count = self.stats.get_total_transcriptions()
-                if current_count != self.last_transcription_count:
-                    self.last_transcription_count = current_count
-                    self._refresh_stats()
-                    self._refresh_history()
-                
-                await asyncio.sleep(2)
+                if await self._poll_stats():
+                    interval = POLL_MIN_SECONDS
+                else:
+                    interval = min(interval * POLL_BACKOFF, POLL_MAX_SECONDS)
             except Exception as e:
                 print(f"Auto-refresh error: {e}")
-                await asyncio.sleep(2)
+            # The next poll is only scheduled once this one has finished;
+            # time spent reloading and redrawing counts towards the interval
+            elapsed = loop.time() - started
+            await asyncio.sleep(max(0.0, interval + random.uniform(-0.1, 0.1) - elapsed))
     
-    def _stop_refresh(self):
-        """Stop the auto-refresh loop."""
-        self.refresh_running = False
+    def _schedule_midnight_relabel(self):
+        """Relabel the history once the date rolls over (e.g. "Today" -> "Yesterday")."""
+        now = datetime.now()
+        midnight = datetime.combine(date.fromordinal(now.toordinal() + 1), datetime.min.time())
+        self._relabel_handle = self._loop.call_later(
+            (midnight - now).total_seconds() + 1, self._relabel_history
+        )
+    
+    def _relabel_history(self):
+        """Re-format the timestamps of the visible history rows."""
+        try:
+            if self.history_list:
+                today = date.today().toordinal()
+                for row in self.history_list.controls:
+                    if isinstance(row, HistoryItem) and row.visible and row.record:
+                        row.set_record(row.record, self._format_timestamp(row.record["timestamp"], today))
+                self._queue_update(self.history_list)
+        except Exception as e:
+            print(f"Relabel error: {e}")
+        self._schedule_midnight_relabel()
+    
+    def _stop_tasks(self):
+        """Cancel the background tasks."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+        if self._relabel_handle is not None:
+            self._relabel_handle.cancel()
+            self._relabel_handle = None
     
     def _on_model_changed(self, e):
         """Handle model dropdown change."""
@@ -210,41 +457,49 @@ class WhisperGUI:
         display_name = HOTKEY_OPTIONS.get(hotkey, hotkey)
         self._show_snackbar(f"Hotkey changed to {display_name}. Restart to apply.")
 
+    def _on_tab_changed(self, e):
+        """Build the Settings tab the first time it is selected."""
+        if e.control.selected_index == 1:
+            self._call_on_loop(self._build_settings_once)
+    
+    def _build_settings_once(self):
+        """Build the Settings tab content unless it already exists."""
+        if self.model_dropdown is None:
+            self._settings_tab.content = self._build_settings_tab()
+            self._queue_update()
+    
     def _show_snackbar(self, message: str):
         """Show a snackbar message."""
         if self.page:
-            self.page.snack_bar = ft.SnackBar(
-                content=ft.Text(message),
-                bgcolor=ft.colors.BLUE_900,
-                open=True,
-            )
-            self.page.update()
+            self._call_on_loop(self._open_snackbar, message)
+    
+    def _open_snackbar(self, message: str):
+        """Open a snackbar with the given message (event loop only)."""
+        self.page.snack_bar = ft.SnackBar(
+            content=ft.Text(message),
+            bgcolor=ft.colors.BLUE_900,
+            open=True,
+        )
+        self._queue_update()
     
     def _get_model_key(self, model_name: str) -> str:
         """Get model key from model name."""
-        for key, (name, _) in AVAILABLE_MODELS.items():
-            if name == model_name:
-                return key
-        return "2"  # Default to base
+        return _MODEL_NAME_TO_KEY.get(model_name, "2")  # Default to base
     
-    def _build_stats_tab(self):
-        """Build the Stats tab content."""
-        # Get current stats
-        total_words = self.stats.get_total_words()
-        total_transcriptions = self.stats.get_total_transcriptions()
-        total_time = self.stats.get_total_audio_time()
-        
-        # Build stat cards with references
-        self.word_count_text = ft.Text(str(total_words), size=28, weight=ft.FontWeight.BOLD)
-        self.transcription_count_text = ft.Text(str(total_transcriptions), size=28, weight=ft.FontWeight.BOLD)
-        self.audio_time_text = ft.Text(self._format_time(total_time), size=28, weight=ft.FontWeight.BOLD)
+    def _build_stat_card(self, icon, icon_color, value: str, label: str):
+        """
+        Build one stat card.
         
-        word_card = ft.Container(
+        Returns:
+            (card, value_text) - value_text is the ft.Text to update on refresh
+        """
+        value_text = _stat_value_text(value)
+        card = ft.Container(
             content=ft.Column(
                 controls=[
-                    ft.Icon(ft.icons.TEXT_FIELDS, size=24, color=ft.colors.BLUE_400),
-                    self.word_count_text,
-                    ft.Text("Words", size=11, color=ft.colors.GREY_500),
+                    ft.Icon(icon, size=24, color=icon_color),
+                    value_text,
+                    _caption_text(label),
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=2,
@@ -254,45 +509,40 @@ class WhisperGUI:
             bgcolor=ft.colors.GREY_900,
             expand=True,
         )
+        return card, value_text
+    
+    def _build_stat_cards(self) -> list:
+        """
+        Build the three stat cards.
         
-        transcription_card = ft.Container(
-            content=ft.Column(
-                controls=[
-                    ft.Icon(ft.icons.MIC, size=24, color=ft.colors.GREEN_400),
-                    self.transcription_count_text,
-                    ft.Text("Sessions", size=11, color=ft.colors.GREY_500),
-                ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=2,
-            ),
-            padding=16,
-            border_radius=12,
-            bgcolor=ft.colors.GREY_900,
-            expand=True,
+        Built once and reused; refreshes only change the value texts.
+        """
+        word_card, self.word_count_text = self._build_stat_card(
+            ft.icons.TEXT_FIELDS, ft.colors.BLUE_400,
+            str(self.stats.get_total_words()), "Words",
         )
-        
-        time_card = ft.Container(
-            content=ft.Column(
-                controls=[
-                    ft.Icon(ft.icons.TIMER, size=24, color=ft.colors.ORANGE_400),
-                    self.audio_time_text,
-                    ft.Text("Audio", size=11, color=ft.colors.GREY_500),
-                ],
-                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                spacing=2,
-            ),
-            padding=16,
-            border_radius=12,
-            bgcolor=ft.colors.GREY_900,
-            expand=True,
+        transcription_card, self.transcription_count_text = self._build_stat_card(
+            ft.icons.MIC, ft.colors.GREEN_400,
+            str(self.stats.get_total_transcriptions()), "Sessions",
+        )
+        time_card, self.audio_time_text = self._build_stat_card(
+            ft.icons.TIMER, ft.colors.ORANGE_400,
+            self._format_time(self.stats.get_total_audio_time()), "Audio",
         )
         
-        # History list
-        self.history_list = ft.Column(
+        return [word_card, transcription_card, time_card]
+    
+    def _build_stats_tab(self):
+        """Build the Stats tab content."""
+        if self._stat_cards is None:
+            self._stat_cards = self._build_stat_cards()
+        
+        # History list (ListView only builds the rows scrolled into view)
+        self.history_list = ft.ListView(
             controls=[],
-            scroll=ft.ScrollMode.AUTO,
             spacing=0,
         )
+        self._rendered_ids = []
         
         # Populate history
         self._refresh_history()
@@ -302,7 +552,7 @@ class WhisperGUI:
                 controls=[
                     # Stats row
                     ft.Row(
-                        controls=[word_card, transcription_card, time_card],
+                        controls=self._stat_cards,
                         spacing=10,
                     ),
                     
@@ -312,7 +562,7 @@ class WhisperGUI:
                             controls=[
                                 ft.Row(
                                     controls=[
-                                        ft.Text("History", size=14, weight=ft.FontWeight.W_500),
+                                        _title_text("History"),
                                         ft.TextButton(
                                             "Clear",
                                             on_click=lambda e: self._clear_history(),
@@ -348,10 +598,7 @@ class WhisperGUI:
         # Model dropdown
         self.model_dropdown = ft.Dropdown(
             value=self._get_model_key(current_model),
-            options=[
-                ft.dropdown.Option(key, desc)
-                for key, (name, desc) in AVAILABLE_MODELS.items()
-            ],
+            options=[ft.dropdown.Option(key, label) for key, label in _MODEL_OPTION_LABELS],
             on_change=self._on_model_changed,
             border_radius=8,
             content_padding=12,
@@ -393,8 +640,8 @@ class WhisperGUI:
                     controls=[
                         ft.Column(
                             controls=[
-                                ft.Text(title, size=14, weight=ft.FontWeight.W_500),
-                                ft.Text(subtitle, size=11, color=ft.colors.GREY_500),
+                                _title_text(title),
+                                _caption_text(subtitle),
                             ],
                             spacing=2,
                             expand=True,
@@ -416,8 +663,8 @@ class WhisperGUI:
                     ft.Container(
                         content=ft.Column(
                             controls=[
-                                ft.Text("Whisper Model", size=14, weight=ft.FontWeight.W_500),
-                                ft.Text("Larger models are more accurate but slower", size=11, color=ft.colors.GREY_500),
+                                _title_text("Whisper Model"),
+                                _caption_text("Larger models are more accurate but slower"),
                                 ft.Container(
                                     content=self.model_dropdown,
                                     padding=ft.padding.only(top=8),
@@ -449,8 +696,8 @@ class WhisperGUI:
                     ft.Container(
                         content=ft.Column(
                             controls=[
-                                ft.Text("Hotkey", size=14, weight=ft.FontWeight.W_500),
-                                ft.Text("Press and hold to record", size=11, color=ft.colors.GREY_500),
+                                _title_text("Hotkey"),
+                                _caption_text("Press and hold to record"),
                                 ft.Container(
                                     content=self.hotkey_dropdown,
                                     padding=ft.padding.only(top=8),
@@ -502,33 +749,29 @@ class WhisperGUI:
         if os.path.exists(ICON_PATH):
             page.window.icon = "icon.ico"
 
-        # Stop refresh when window closes
+        # Stop the background tasks when the window closes
         def on_window_event(e):
             if e.data == "close":
-                self._stop_refresh()
+                self._stop_tasks()
         
         page.window.on_event = on_window_event
         
-        # Initialize tracking
-        self.last_transcription_count = self.stats.get_total_transcriptions()
-        
-        # Start auto-refresh background task
-        page.run_task(self._auto_refresh_loop)
-        
         # Build tabs
         stats_tab = ft.Tab(
             text="Stats",
             content=self._build_stats_tab(),
         )
 
-        settings_tab = ft.Tab(
+        # Settings content is built when the tab is first opened
+        self._settings_tab = ft.Tab(
             text="Settings",
-            content=self._build_settings_tab(),
+            content=ft.Container(),
         )
         
         tabs = ft.Tabs(
             selected_index=0,
-            tabs=[stats_tab, settings_tab],
+            tabs=[stats_tab, self._settings_tab],
+            on_change=self._on_tab_changed,
             expand=True,
         )
         
@@ -559,31 +802,58 @@ class WhisperGUI:
                 bgcolor=ft.colors.BLACK,
             )
         )
+        
+        # Redraw on stats changes; the loop watches for writes from the app.
+        # Started once the page is built so it never redraws a half-built tree
+        self.stats.add_listener(self._on_stats_changed)
+        self._tasks = [
+            page.run_task(self._redraw_loop),
+            page.run_task(self._auto_refresh_loop),
+        ]
+    
+    def _close_clear_dialog(self, e):
+        """Dismiss the clear-history dialog."""
+        self._call_on_loop(self._dismiss_clear_dialog)
+    
+    def _dismiss_clear_dialog(self):
+        """Close the clear-history dialog (event loop only)."""
+        self._clear_dialog.open = False
+        self._queue_update()
+    
+    def _confirm_clear(self, e):
+        """Clear history and dismiss the dialog."""
+        self.stats.clear_history()
+        self._call_on_loop(self._finish_clear)
+    
+    def _finish_clear(self):
+        """Redraw the cleared history and close the dialog (event loop only)."""
+        # Redraw here so it goes out with closing the dialog; the redraw
+        # task then finds nothing left to change
+        with self._batch():
+            self.refresh()
+            self._clear_dialog.open = False
+            self._queue_update()
     
     def _clear_history(self):
         """Clear history after confirmation."""
         if self.page:
-            def close_dialog(e):
-                dialog.open = False
-                self.page.update()
-            
-            def confirm_clear(e):
-                self.stats.clear_history()
-                self._refresh_history()
-                dialog.open = False
-                self.page.update()
-            
-            dialog = ft.AlertDialog(
+            self._call_on_loop(self._open_clear_dialog)
+    
+    def _open_clear_dialog(self):
+        """Create the clear-history dialog once and open it (event loop only)."""
+        # One dialog for the window's lifetime, added to the overlay once
+        if self._clear_dialog is None:
+            self._clear_dialog = ft.AlertDialog(
                 title=ft.Text("Clear History?"),
                 content=ft.Text("This will delete all transcription history. Stats totals will be kept."),
                 actions=[
-                    ft.TextButton("Cancel", on_click=close_dialog),
-                    ft.TextButton("Clear", on_click=confirm_clear),
+                    ft.TextButton("Cancel", on_click=self._close_clear_dialog),
+                    ft.TextButton("Clear", on_click=self._confirm_clear),
                 ],
             )
-            self.page.overlay.append(dialog)
-            dialog.open = True
-            self.page.update()
+            self.page.overlay.append(self._clear_dialog)
+        self._clear_dialog.open = True
+        self._queue_update()
 
 
 def run_gui(on_model_change=None):
@@ -5,11 +5,27 @@ Tracks transcription statistics and history with JSON persistence.
 """
 
 from __future__ import annotations
+import atexit
+import functools
 import json
 import os
-from datetime import datetime
+import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Timer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+
+# Changes are written to disk at most this often (seconds)
+SAVE_DELAY = 0.25
+
+# Number of transcription records kept in the history
+HISTORY_LIMIT = 100
 
 
 class StatsManager:
@@ -20,35 +36,118 @@ class StatsManager:
         self.stats_file = self.data_dir / "stats.json"
         self.lock = Lock()
         
+        # (mtime, size) of the stats file as last read or written by us
+        self._file_signature = None
+        
         # Load existing stats or create new
         self.stats = self._load_stats()
+        
+        # Callbacks run after the stats change (see add_listener)
+        self._listeners = []
+        
+        # Pending-write state; saves happen on a timer thread, off the
+        # transcription path, and bursts collapse into one write
+        self._dirty = False
+        self._flush_timer = None
+        atexit.register(self.flush)
+    
+    def _stat_file(self):
+        """Return the stats file's (mtime, size), or None if it is missing."""
+        try:
+            st = os.stat(self.stats_file)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
     
     def _load_stats(self):
         """Load stats from JSON file."""
-        if self.stats_file.exists():
-            try:
-                with open(self.stats_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
+        self._file_signature = self._stat_file()
+        try:
+            raw = self.stats_file.read_bytes()
+            stats = orjson.loads(raw) if orjson else json.loads(raw)
+        except (json.JSONDecodeError, IOError):
+            # Missing or unreadable - start fresh
+            stats = {
+                "total_words": 0,
+                "total_transcriptions": 0,
+                "total_audio_seconds": 0.0,
+                "history": [],  # List of transcription records
+                "current_model": "base"
+            }
         
-        # Default stats structure
-        return {
-            "total_words": 0,
-            "total_transcriptions": 0,
-            "total_audio_seconds": 0.0,
-            "history": [],  # List of transcription records
-            "current_model": "base"
-        }
+        # Newest first; the bounded deque drops the oldest record on insert
+        stats["history"] = deque(stats.get("history", ()), maxlen=HISTORY_LIMIT)
+        return stats
     
     def _save_stats(self):
-        """Save stats to JSON file."""
+        """Save stats to JSON file (via a temp file, so it is never half-written)."""
+        tmp_file = self.stats_file.with_suffix(".tmp")
+        # Compact, machine-read file; default=list writes the history deque
+        # as a JSON list
+        if orjson:
+            data = orjson.dumps(self.stats, default=list)
+        else:
+            data = json.dumps(self.stats, separators=(",", ":"), default=list).encode("ascii")
         try:
-            with open(self.stats_file, "w", encoding="utf-8") as f:
-                json.dump(self.stats, f, indent=2, ensure_ascii=False)
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.stats_file)
+            self._file_signature = self._stat_file()
         except IOError as e:
             print(f"Error saving stats: {e}")
     
+    def _schedule_save(self):
+        """Mark stats dirty and start the flush timer. Caller holds the lock."""
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = Timer(SAVE_DELAY, self.flush)
+            self._flush_timer.start()
+    
+    def flush(self):
+        """Write pending changes to disk now."""
+        with self.lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._save_stats()
+                self._dirty = False
+    
+    def add_listener(self, callback):
+        """
+        Register a callback to run after the stats change.
+        
+        Args:
+            callback: Called with no arguments after a transcription is added,
+                history is cleared, stats are reset, or reload() picks up
+                changes written by another process
+        """
+        self._listeners.append(callback)
+    
+    def _notify(self):
+        """Run every listener. Called without the lock held."""
+        for callback in self._listeners:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Stats listener error: {e}")
+    
+    def reload(self) -> bool:
+        """
+        Re-read stats from disk, notifying listeners if they changed.
+        
+        Returns:
+            True if the file held different stats than this instance
+        """
+        if self._dirty or self._stat_file() == self._file_signature:
+            return False  # Own changes pending, or untouched since we read/wrote it
+        stats = self._load_stats()
+        with self.lock:
+            if stats == self.stats:
+                return False
+            self.stats = stats
+        self._notify()
+        return True
+    
     def add_transcription(self, text: str, audio_duration: float, model: str):
         """
         Record a new transcription.
@@ -57,9 +156,12 @@ class StatsManager:
             text: The transcribed text
             audio_duration: Duration of the audio in seconds
             model: The model used for transcription
+            
+        Returns:
+            Number of words recorded (0 if the text was empty)
         """
         if not text or not text.strip():
-            return
+            return 0
         
         word_count = len(text.split())
         
@@ -69,21 +171,20 @@ class StatsManager:
             self.stats["total_transcriptions"] += 1
             self.stats["total_audio_seconds"] += audio_duration
             
-            # Add to history (keep last 100 entries)
+            # Add to history (keeps the last HISTORY_LIMIT entries)
             record = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": time.time(),  # Epoch seconds; formatted for display by the GUI
                 "text": text.strip(),
                 "word_count": word_count,
                 "audio_duration": round(audio_duration, 1),
                 "model": model
             }
-            self.stats["history"].insert(0, record)
-            
-            # Limit history size
-            if len(self.stats["history"]) > 100:
-                self.stats["history"] = self.stats["history"][:100]
+            self.stats["history"].appendleft(record)
             
-            self._save_stats()
+            self._schedule_save()
+        
+        self._notify()
+        return word_count
     
     def get_total_words(self) -> int:
         """Get total words transcribed."""
@@ -99,7 +200,8 @@ class StatsManager:
     
     def get_history(self, limit: int = 50) -> list:
         """Get transcription history."""
-        return self.stats["history"][:limit]
+        with self.lock:
+            return list(islice(self.stats["history"], limit))
     
     def get_current_model(self) -> str:
         """Get the currently selected model."""
@@ -109,13 +211,14 @@ class StatsManager:
         """Set the current model."""
         with self.lock:
             self.stats["current_model"] = model
-            self._save_stats()
+            self._schedule_save()
     
     def clear_history(self):
         """Clear transcription history but keep totals."""
         with self.lock:
-            self.stats["history"] = []
-            self._save_stats()
+            self.stats["history"] = deque(maxlen=HISTORY_LIMIT)
+            self._schedule_save()
+        self._notify()
     
     def reset_all(self):
         """Reset all stats."""
@@ -124,19 +227,15 @@ class StatsManager:
                 "total_words": 0,
                 "total_transcriptions": 0,
                 "total_audio_seconds": 0.0,
-                "history": [],
+                "history": deque(maxlen=HISTORY_LIMIT),
                 "current_model": self.stats.get("current_model", "tiny")
             }
-            self._save_stats()
+            self._schedule_save()
+        self._notify()
 
 
 # Global instance
-_stats_manager = None
-
-
+@functools.cache
 def get_stats_manager() -> StatsManager:
     """Get the global stats manager instance."""
-    global _stats_manager
-    if _stats_manager is None:
-        _stats_manager = StatsManager()
-    return _stats_manager
+    return StatsManager()
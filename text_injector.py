@@ -2,6 +2,7 @@
 Text Injector - Types or pastes text into the focused application
 """
 
+import ctypes
 import pyperclip
 from pynput.keyboard import Controller, Key
 from config import USE_CLIPBOARD
@@ -10,6 +11,17 @@ from config import USE_CLIPBOARD
 class TextInjector:
     def __init__(self):
         self.keyboard = Controller()
+        self._target_hwnd = None
+
+    def remember_target(self):
+        """Remember the focused window so inject() can send the text there."""
+        self._target_hwnd = ctypes.windll.user32.GetForegroundWindow()
+
+    def _restore_focus(self):
+        """Bring the remembered window back to the foreground if it lost focus."""
+        user32 = ctypes.windll.user32
+        if self._target_hwnd and user32.GetForegroundWindow() != self._target_hwnd:
+            user32.SetForegroundWindow(self._target_hwnd)
 
     def inject(self, text):
         """
@@ -17,35 +29,30 @@ class TextInjector:
         
         Uses clipboard paste for instant injection (USE_CLIPBOARD=True)
         or types character-by-character (USE_CLIPBOARD=False).
+        Typing is also the fallback when the clipboard cannot be opened.
         """
         if not text:
             return
 
+        self._restore_focus()
+
         if USE_CLIPBOARD:
-            self._paste_text(text)
-        else:
-            self._type_text(text)
+            try:
+                self._paste_text(text)
+                return
+            except pyperclip.PyperclipException as e:
+                print(f"Clipboard unavailable ({e}), typing instead")
+        self._type_text(text)
 
     def _paste_text(self, text):
         """Paste text using clipboard (instant)."""
-        # Save current clipboard content
-        try:
-            old_clipboard = pyperclip.paste()
-        except:
-            old_clipboard = ""
-
-        # Copy new text to clipboard
+        # Copy new text to clipboard. The previous contents are not saved:
+        # the transcribed text is left there as user might want to paste it again
         pyperclip.copy(text)
 
         # Simulate Ctrl+V to paste
-        self.keyboard.press(Key.ctrl)
-        self.keyboard.press('v')
-        self.keyboard.release('v')
-        self.keyboard.release(Key.ctrl)
-
-        # Small delay then restore old clipboard (optional)
-        # For now, we leave the transcribed text in clipboard
-        # as user might want to paste it again
+        with self.keyboard.pressed(Key.ctrl):
+            self.keyboard.tap('v')
 
     def _type_text(self, text):
         """Type text character-by-character (slower but more compatible)."""
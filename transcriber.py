@@ -2,47 +2,131 @@
 Transcriber - Whisper speech-to-text using faster-whisper
 
 faster-whisper is a reimplementation of OpenAI's Whisper using CTranslate2,
-which is much faster and works well on CPU.
+which is much faster and works well on CPU. It is imported on first use,
+from the background preload/warm-up threads, so importing this module
+stays cheap.
 """
 
+import os
+import threading
 import numpy as np
-from faster_whisper import WhisperModel
-from config import WHISPER_THREADS
+from config import (
+    SAMPLE_RATE, WHISPER_THREADS, WHISPER_DEVICE, WHISPER_BEAM_SIZE, STREAM_CHUNK_SECONDS
+)
+from models import AVAILABLE_MODELS  # Re-exported for existing importers
 
 
-# Available models with descriptions
-AVAILABLE_MODELS = {
-    "1": ("tiny", "Tiny (~75MB) - Fastest, lower accuracy"),
-    "2": ("base", "Base (~142MB) - Fast, decent accuracy"),
-    "3": ("small", "Small (~466MB) - Medium speed, good accuracy"),
-    "4": ("medium", "Medium (~1.5GB) - Slower, better accuracy"),
+# Quantized CTranslate2 compute type per device: int8 weights everywhere,
+# with float16 activations on GPU
+DEFAULT_COMPUTE_TYPES = {
+    "cpu": "int8",
+    "cuda": "int8_float16",
 }
 
 
+def preload_model_files(model_name):
+    """
+    Read a downloaded model's files once to warm the OS page cache.
+
+    Meant to run in a background thread while the user is still choosing a
+    model, so the later WhisperModel load reads from memory instead of disk.
+    Does nothing if the model has not been downloaded yet.
+    """
+    from faster_whisper import download_model
+    
+    try:
+        model_dir = download_model(model_name, local_files_only=True)
+    except Exception:
+        return
+
+    chunk = bytearray(1024 * 1024)
+    for name in os.listdir(model_dir):
+        path = os.path.join(model_dir, name)
+        if not os.path.isfile(path):
+            continue
+        try:
+            with open(path, "rb") as f:
+                while f.readinto(chunk):
+                    pass
+        except OSError:
+            pass
+
+
 class Transcriber:
-    def __init__(self, model_name="base"):
+    def __init__(self, model_name="base", device=WHISPER_DEVICE, compute_type=None):
+        """
+        Args:
+            model_name: Whisper model size (see AVAILABLE_MODELS)
+            device: "cpu" or "cuda"
+            compute_type: CTranslate2 compute type; defaults per device
+        """
         self.model = None
         self.model_name = model_name
+        self.device = device
+        self.compute_type = compute_type or DEFAULT_COMPUTE_TYPES.get(device, "int8")
 
     def load_model(self):
         """Load the whisper model. Call once at startup."""
-        print(f"Loading whisper model ({self.model_name})...")
+        print(f"Loading whisper model ({self.model_name}, {self.device}/{self.compute_type})...")
         print("This may take a minute on first run (downloading model)...")
+        from faster_whisper import WhisperModel
         
         self.model = WhisperModel(
             self.model_name,
-            device="cpu",
-            compute_type="int8",  # Use int8 for faster CPU inference
+            device=self.device,
+            compute_type=self.compute_type,
             cpu_threads=WHISPER_THREADS
         )
         print("Model loaded successfully!")
 
-    def transcribe(self, audio_data):
+    def warm_up(self):
         """
-        Transcribe audio data to text.
+        Run one throwaway inference on a second of silence.
+
+        The first real inference otherwise pays for one-time kernel setup.
+        VAD is disabled here because it would drop the silent clip before
+        the model ever ran.
+        """
+        if self.model is None:
+            return
+
+        silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        segments, _ = self.model.transcribe(silence, beam_size=1, language="en")
+        for _ in segments:
+            pass  # Segments are generated lazily - consume them
+
+    def find_pause(self, audio_data, min_silence_ms=500):
+        """
+        Find a cut point inside a pause at the end of audio_data.
         
         Args:
             audio_data: numpy array of audio samples (float32, 16kHz, mono)
+            min_silence_ms: How long the trailing pause must be
+            
+        Returns:
+            Sample index in the middle of the trailing pause, or None if the
+            audio contains no speech or does not end in a pause
+        """
+        from faster_whisper.vad import get_speech_timestamps
+        
+        speech = get_speech_timestamps(audio_data, min_silence_duration_ms=min_silence_ms)
+        if not speech:
+            return None
+        
+        silence_start = speech[-1]["end"]
+        min_gap = min_silence_ms * SAMPLE_RATE // 1000
+        if len(audio_data) - silence_start < min_gap:
+            return None
+        return silence_start + min_gap // 2
+
+    def transcribe(self, audio_data, prompt=None):
+        """
+        Transcribe audio data to text.
+        
+        Args:
+            audio_data: numpy array of audio samples (float32, 16kHz, mono).
+                Out-of-range float32 audio is normalized in place.
+            prompt: Text spoken just before this audio, used as decoder context
             
         Returns:
             Transcribed text string
@@ -54,22 +138,26 @@ class Transcriber:
             return ""
 
         try:
-            # Ensure audio is float32 and normalized
-            if audio_data.dtype != np.float32:
-                audio_data = audio_data.astype(np.float32)
+            # Ensure audio is contiguous float32 (no copy if it already is)
+            audio_data = np.ascontiguousarray(audio_data, dtype=np.float32)
             
-            # Normalize if needed (should already be in range [-1, 1] from sounddevice)
-            max_val = np.max(np.abs(audio_data))
+            # Normalize if needed (should already be in range [-1, 1] from sounddevice).
+            # min/max reductions avoid an |x| temporary; scaling happens in place
+            max_val = max(-audio_data.min(), audio_data.max())
             if max_val > 1.0:
-                audio_data = audio_data / max_val
+                np.multiply(audio_data, np.float32(1.0 / max_val), out=audio_data)
             
             # Transcribe
             segments, info = self.model.transcribe(
                 audio_data,
-                beam_size=5,
+                beam_size=WHISPER_BEAM_SIZE,
+                temperature=0.0,  # No temperature fallback re-decodes
+                condition_on_previous_text=False,
+                without_timestamps=True,  # Only the text is used
                 language="en",  # Set to None for auto-detection
                 vad_filter=True,  # Filter out non-speech
-                vad_parameters=dict(min_silence_duration_ms=500)
+                vad_parameters=dict(min_silence_duration_ms=500),
+                initial_prompt=prompt
             )
             
             # Combine all segments into a single text
@@ -83,3 +171,81 @@ class Transcriber:
         except Exception as e:
             print(f"Transcription error: {e}")
             return ""
+
+
+class StreamingSession:
+    """
+    Transcribes a recording piece by piece while it is still being captured.
+    
+    A background thread polls the audio captured so far. Whenever the
+    untranscribed part is at least STREAM_CHUNK_SECONDS long and ends in a
+    pause, it transcribes up to that pause, passing the text so far as the
+    prompt. finish() then only has to transcribe the tail after release.
+    """
+    
+    POLL_SECONDS = 0.5
+    
+    def __init__(self, transcriber, get_audio):
+        """
+        Args:
+            transcriber: Loaded Transcriber to use
+            get_audio: Callable returning the float32 audio captured so far
+        """
+        self.transcriber = transcriber
+        self.get_audio = get_audio
+        self._committed = 0  # Samples already transcribed
+        self._parts = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def start(self):
+        """Start transcribing in the background."""
+        self._thread.start()
+    
+    def cancel(self):
+        """Stop the background thread without waiting for it."""
+        self._stop.set()
+    
+    def finish(self, audio_data):
+        """
+        Stop the background thread and transcribe the rest of the recording.
+        
+        Args:
+            audio_data: The complete recording, as returned by the recorder
+            
+        Returns:
+            Transcribed text of the whole recording
+        """
+        self._stop.set()
+        self._thread.join()
+        
+        tail = audio_data[self._committed:]
+        if len(tail) > 0:
+            self._transcribe(tail)
+        return " ".join(self._parts)
+    
+    def _run(self):
+        """Background loop: transcribe finished sentences as they come in."""
+        min_samples = int(STREAM_CHUNK_SECONDS * SAMPLE_RATE)
+        while not self._stop.wait(self.POLL_SECONDS):
+            try:
+                pending = self.get_audio()[self._committed:]
+                if len(pending) < min_samples:
+                    continue
+                
+                cut = self.transcriber.find_pause(pending)
+                if cut is None:
+                    continue
+                
+                self._transcribe(pending[:cut])
+                self._committed += cut
+            except Exception as e:
+                print(f"Streaming transcription error: {e}")
+                return  # finish() will transcribe everything not committed
+    
+    def _transcribe(self, audio_data):
+        """Transcribe one piece, using the text so far as context."""
+        prompt = " ".join(self._parts) or None
+        text = self.transcriber.transcribe(audio_data, prompt=prompt)
+        if text:
+            self._parts.append(text)
@@ -2,10 +2,51 @@
 System Tray Icon - Shows recording status in the Windows system tray
 """
 
+import base64
+import functools
+import io
 import threading
-from PIL import Image, ImageDraw
+from PIL import Image
 import pystray
 from config import APP_NAME
+from state_bus import State
+
+
+# Tray icons as 64x64 RGBA PNGs: a microphone (body, stand, base) in gray
+# when idle, in red with a recording dot when recording. Rendered once
+# offline so startup skips the PIL drawing calls.
+_ICON_IDLE_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABBUlEQVR42u2asRbCMAhFG46f6+ro"
+    "5Ojq/+rk4jn2xIRHg9y3F8gFkrR02xBCCCFUVS3K0flyff76zON+a+kBjCw8EoStvnhPO6EAvINW"
+    "QbAMi1fata24LEv2VfapAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAATEo9zPC2TwVkyJLSrmUpVRXU"
+    "YaOfn6e/BaicDfbGsKeTusfeQa06HZYDiFzMoXuAeiKk8mf/ktHReGzFrET6MW/qRwxHZ6qxKTPi"
+    "2SYqHy2iLGeCVNl1B9Bb/j1Be9kJBxC1EXq2luwoU4BQHL3l/xMMv8xE9veSALzf5pb9HpBFAAAA"
+    "AGqr/EWIFgAAQqiyXtxhfR0tqHXMAAAAAElFTkSuQmCC"
+)
+_ICON_RECORDING_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAYAAACqaXHeAAABR0lEQVR42u2a0RnCIAyEIZ+juIIj"
+    "OLUjuIK71Cdf+gmFkktJuHu0Nc39QKDQlCiKWlk5mqEtpe2PyaJPiW6+9nsoADWTteuygvmD4WGj"
+    "z+O59f7n/n5lLfOlmpBnNN4DYhSAzG5eM45pDdBOGgVBPJhHxnU/C+TOOra/X7y0fi1+K4R/94VZ"
+    "CB1BKF0PtRQumazBuQV8u+uqCZIWFwEQAAEQAAEQAAEQAAEQAAEQAAEQgIJaDjNmis8e4KGVkHHF"
+    "S1dFQT0ddL89XUoQeTbYmkNN8E3RX1Ko0+FRme0KW5i5tAagT4RQz5MoLXo2H5mxVSyfI9rUrzgc"
+    "HemNGdkimsME9Yxs0S1HkkTFVQfQ2v1bktaKYw7AqhBqDi3YVIYAgZh63X8nOD2AK8f3lAC03+am"
+    "3Q/wIgIgAAJYW8svhDgECICiqJX1BWunjxwZaLoeAAAAAElFTkSuQmCC"
+)
+
+
+@functools.cache
+def _create_icon(recording=False):
+    """
+    Create a simple microphone icon.
+    
+    Cached, so every TrayIcon shares the same two images.
+    
+    Args:
+        recording: If True, icon is red. If False, icon is gray.
+    """
+    image = Image.open(io.BytesIO(_ICON_RECORDING_PNG if recording else _ICON_IDLE_PNG))
+    image.load()
+    return image
 
 
 class TrayIcon:
@@ -22,78 +63,17 @@ class TrayIcon:
         self.icon = None
         self.is_recording = False
         
-        # Create the icons
-        self.icon_idle = self._create_icon(recording=False)
-        self.icon_recording = self._create_icon(recording=True)
+        # Both icons and menus are built once; set_recording just swaps them
+        self.icon_idle = _create_icon(recording=False)
+        self.icon_recording = _create_icon(recording=True)
+        self._menu_idle = self._create_menu(recording=False)
+        self._menu_recording = self._create_menu(recording=True)
 
-    def _create_icon(self, recording=False):
-        """
-        Create a simple microphone icon.
-        
-        Args:
-            recording: If True, icon is red. If False, icon is gray.
-        """
-        # Create a 64x64 image
-        size = 64
-        image = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(image)
-        
-        # Colors
-        if recording:
-            main_color = (220, 53, 69)  # Red
-            accent_color = (255, 100, 100)
-        else:
-            main_color = (108, 117, 125)  # Gray
-            accent_color = (150, 150, 150)
-        
-        # Draw microphone body (rounded rectangle)
-        mic_left = 20
-        mic_right = 44
-        mic_top = 8
-        mic_bottom = 38
-        draw.rounded_rectangle(
-            [mic_left, mic_top, mic_right, mic_bottom],
-            radius=8,
-            fill=main_color
-        )
-        
-        # Draw microphone stand (arc)
-        draw.arc(
-            [14, 24, 50, 50],
-            start=0,
-            end=180,
-            fill=main_color,
-            width=4
-        )
-        
-        # Draw microphone base (line)
-        draw.line(
-            [(32, 50), (32, 58)],
-            fill=main_color,
-            width=4
-        )
-        
-        # Draw base horizontal line
-        draw.line(
-            [(22, 58), (42, 58)],
-            fill=main_color,
-            width=4
-        )
-        
-        # Add recording indicator dot if recording
-        if recording:
-            draw.ellipse(
-                [48, 4, 60, 16],
-                fill=(255, 0, 0)
-            )
-        
-        return image
-
-    def _create_menu(self):
+    def _create_menu(self, recording=False):
         """Create the right-click menu for the tray icon."""
         return pystray.Menu(
             pystray.MenuItem(
-                "Status: Recording" if self.is_recording else "Status: Idle",
+                "Status: Recording" if recording else "Status: Idle",
                 None,
                 enabled=False
             ),
@@ -125,15 +105,23 @@ class TrayIcon:
         if self.icon:
             self.icon.icon = self.icon_recording if is_recording else self.icon_idle
             # Update menu to reflect new status
-            self.icon.menu = self._create_menu()
+            self.icon.menu = self._menu_recording if is_recording else self._menu_idle
+
+    def on_state(self, state, **data):
+        """State bus subscriber: show the recording icon until processing ends."""
+        is_recording = state in (State.RECORDING, State.PROCESSING)
+        if is_recording != self.is_recording:
+            self.set_recording(is_recording)
 
     def run(self):
         """Start the system tray icon (blocking)."""
+        # Icon and menu come from the same flag so they start in agreement
+        is_recording = self.is_recording
         self.icon = pystray.Icon(
             APP_NAME,
-            self.icon_idle,
+            self.icon_recording if is_recording else self.icon_idle,
             APP_NAME,
-            menu=self._create_menu()
+            menu=self._menu_recording if is_recording else self._menu_idle
         )
         self.icon.run()
 